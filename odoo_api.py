@@ -8,40 +8,106 @@ in a clean, well‑documented REST API – ready to be consumed by an LLM‑powe
 Key design goals
 ----------------
 * **1‑to‑1 mapping** – Every public SDK helper has an HTTP endpoint.
-* **Stateless** – Each request receives its own authenticated
-  :class:`~odoo_sdk.OdooClient`; TCP session pooling reduces overhead.
+* **Stateless** – Every request is served by one shared, authenticated
+  :class:`~odoo_sdk.AsyncOdooClient` per worker on top of a pooled
+  ``httpx.AsyncClient``: no per-request login, and the event loop is never
+  blocked on Odoo I/O.
 * **Rich OpenAPI** – Detailed summaries *and* long‑form descriptions with
   concrete examples for every route, so that an agent can discover the API
   autonomously.
 * **LLM friendly** – Simple JSON payloads; many2one fields are ‘flattened’
   in responses (``[id, label] → id``) and dates are ISO‑8601 ``YYYY‑MM‑DD``.
-* **Minimal deps** – Only *fastapi*, *uvicorn[standard]*, *pydantic* and
-  *requests* (pulled in by the SDK).
+* **Minimal deps** – Only *fastapi*, *uvicorn[standard]*, *pydantic*,
+  *httpx*, *orjson* / *msgspec* (response encoding) and *requests* (pulled
+  in by the SDK).
 
 Usage quick‑start
 ~~~~~~~~~~~~~~~~~
 export ODOO_URL=https://my.odoo.com/jsonrpc \
         ODOO_DB=my ODOO_USER=bot@my.com ODOO_API_KEY=***
-uvicorn odoo_api:app --reload --port 8777
+uvicorn odoo_api:app --loop uvloop --http httptools --port 8777
 
+or simply ``python odoo_api.py`` (one worker per CPU, same loop/parser).
 Then browse http://localhost:8777/docs for the interactive Swagger UI.
 
 """
 from __future__ import annotations
 
+import asyncio
+import functools
+import logging
 import os
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from fastapi import Depends, FastAPI, File, HTTPException, UploadFile
-from pydantic import BaseModel, Field
+import httpx
+import msgspec
+from cachetools import TTLCache
+from fastapi import Depends, FastAPI, File, HTTPException, Query, Request, Response, UploadFile
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, Field, field_serializer
 
-from odoo_sdk import OdooClient, JSON  # ← your improved SDK v0.4 import
+import odoo_sdk
+from odoo_sdk import AsyncOdooClient, JSON  # ← your improved SDK v0.4 import
+
+logger = logging.getLogger("uvicorn.error")  # shares uvicorn's handlers/level
 
 ######################################################################
 # FastAPI – app & dependency                                          #
 ######################################################################
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Own the process-wide HTTP connection pool and Odoo client.
+
+    The credentials are injected via *env‑vars* – adjust them on your server or
+    in a docker‑compose file. For demo purposes the fallback below hard‑codes
+    placeholder values – **do _not_ keep this in production!**
+
+    ``ODOO_POOL_SIZE`` bounds the number of sockets towards Odoo (default 64,
+    half of them kept alive between requests).
+    """
+    logger.info(
+        "Event loop: %s (policy %s)",
+        type(asyncio.get_running_loop()).__module__,
+        type(asyncio.get_event_loop_policy()).__name__,
+    )
+    pool = int(os.getenv("ODOO_POOL_SIZE", "64"))
+    app.state.http = httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,  # retry failed connection attempts (connect errors/timeouts only)
+            limits=httpx.Limits(
+                max_connections=pool,
+                max_keepalive_connections=pool // 2,
+                keepalive_expiry=60,
+            ),
+        ),
+        timeout=30,
+    )
+    app.state.odoo = AsyncOdooClient(
+        os.getenv("ODOO_URL", "URL"),
+        os.getenv("ODOO_DB", "DB"),
+        os.getenv("ODOO_USER", "USER"),
+        os.getenv("ODOO_API_KEY", "KEY"),
+        client=app.state.http,
+    )
+    # Build the OpenAPI document now (FastAPI memoises it in app.openapi_schema)
+    # so the first /docs or /openapi.json hit does not pay for schema generation.
+    app.openapi()
+    try:
+        yield
+    finally:
+        await app.state.http.aclose()
+
+
+# Recent FastAPI releases serialise responses to JSON bytes via Pydantic and mark
+# ORJSONResponse as deprecated (warning on every route's first hit): use orjson
+# only on releases where it is still the faster path.
+_DEFAULT_RESPONSE = JSONResponse if getattr(ORJSONResponse, "__deprecated__", None) else ORJSONResponse
+
 app = FastAPI(
     title="Odoo 18 JSON‑RPC Gateway",
     version="0.4.0",
@@ -62,47 +128,112 @@ app = FastAPI(
         "url": "https://github.com/your-org/odoo-sdk",
         "email": "support@example.com",
     },
-    root_path="/odoo-api"
+    root_path="/odoo-api",
+    # Explicit, because the schema is precomputed in ``lifespan``: older
+    # FastAPI releases only add the root_path server while serving
+    # /openapi.json *before* the first build, so it would be missing.
+    servers=[{"url": "/odoo-api"}],
+    lifespan=lifespan,
+    default_response_class=_DEFAULT_RESPONSE,
 )
+# List payloads (repeated keys, HTML descriptions) shrink 5‑10×; a moderate
+# level keeps the CPU cost well below the encoding savings.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
-def get_client() -> OdooClient:  # dependency
-    """Return an **authenticated** :class:`OdooClient` for the current request.
+async def get_client(request: Request) -> AsyncOdooClient:  # dependency
+    """Return the worker‑wide **authenticated** :class:`AsyncOdooClient`.
 
-    The credentials are injected via *env‑vars* – adjust them on your server or
-    in a docker‑compose file. For demo purposes the fallback below hard‑codes
-    the public Odoo *Sandbox* instance – **do _not_ keep this in production!**
+    Login happens once, on first use; afterwards the cached *uid* is reused by
+    every request (the client holds no other per-request state).
     """
+    odoo: AsyncOdooClient = request.app.state.odoo
+    if odoo.uid is None:
+        await odoo.authenticate()
+    return odoo
 
-    url = os.getenv("ODOO_URL", "URL")
-    db = os.getenv("ODOO_DB", "DB")
-    user = os.getenv("ODOO_USER", "USER")
-    key = os.getenv("ODOO_API_KEY", "KEY")
+######################################################################
+# Utility – normalise Odoo records for Pydantic                      #
+######################################################################
 
 
-    with OdooClient(url, db, user, key) as odoo:
-        yield odoo  # FastAPI closes the context‑manager after the response
+def _normalize_tasks(recs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Flatten M2O fields (``[id, label] → id``), strip the time part from
+    *date_deadline* and map Odoo's ``False`` placeholders to ``None``.
+
+    Works **in place** – the rows come straight from the RPC decoder and are
+    not reused – and returns *recs* for convenience.
+    """
+    for r in recs:
+        v = r.get("project_id")
+        r["project_id"] = v[0] if type(v) is list else v or None
+        v = r.get("stage_id")
+        r["stage_id"] = v[0] if type(v) is list else v or None
+        v = r.get("parent_id")
+        r["parent_id"] = v[0] if type(v) is list else v or None
+        r["state"] = r.get("state") or None
+        d = r.get("date_deadline")
+        r["date_deadline"] = d[:10] if d else None
+    return recs
+
+async def _iter_upload(file: UploadFile, size: int = 64 * 1024) -> AsyncIterator[bytes]:
+    """Yield an :class:`UploadFile` in *size*-byte chunks."""
+    while chunk := await file.read(size):
+        yield chunk
 
 ######################################################################
-# Utility – normalise Odoo records for Pydantic                      #
+# Read cache – short‑TTL memoisation of GET routes                    #
 ######################################################################
 
+# Bumped by every write endpoint; being part of the cache key, it makes all
+# earlier entries unreachable at once (they age out of their TTLCache).
+_cache_generation = 0
+
+
+def _invalidate_reads() -> None:
+    """Make every cached GET response stale – call after any Odoo write."""
+    global _cache_generation
+    _cache_generation += 1
+
+
+# Opt-in: seconds to memoise GET routes, 0 (default) disables the cache.
+_CACHE_TTL = float(os.getenv("ODOO_API_CACHE_TTL", "0"))
+
+
+def cached_endpoint(ttl: float | None = None, maxsize: int = 256):
+    """Memoise an async GET endpoint for *ttl* seconds (default ``ODOO_API_CACHE_TTL``).
+
+    The key is made of the endpoint's path/query parameters (the injected
+    ``odoo`` client is ignored) plus the current write generation.
+
+    Cache and generation counter live **in the worker process**: a write only
+    invalidates the worker that handled it, so enable the cache **only with a
+    single worker** – with several, another one may serve pre-write data for
+    up to *ttl* seconds. With a TTL of 0 the endpoint is returned unwrapped.
+    """
+    ttl = _CACHE_TTL if ttl is None else ttl
 
-def _m2o_id(val):
-    """Return the *id* of a many2one tuple ``[id, label]`` (or the input)."""
-    return val[0] if isinstance(val, (list, tuple)) else val
+    def decorator(fn):
+        if ttl <= 0:
+            return fn
 
+        cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
 
-def _normalize_task(rec: Dict[str, Any]) -> Dict[str, Any]:
-    """Flatten M2O fields and strip the time part from *date_deadline*."""
-    out = rec.copy()
-    out["project_id"] = _m2o_id(out.get("project_id"))
-    out["stage_id"] = _m2o_id(out.get("stage_id"))
-    if out.get("parent_id"):
-        out["parent_id"] = _m2o_id(out["parent_id"])
-    if out.get("date_deadline"):
-        out["date_deadline"] = out["date_deadline"][:10]
-    return out
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = (_cache_generation, *sorted((k, v) for k, v in kwargs.items() if k != "odoo"))
+            hit = cache.get(key)
+            if hit is None:
+                hit = cache[key] = await fn(*args, **kwargs)
+            if isinstance(hit, Response):
+                # Middlewares (e.g. GZip) rewrite the headers of the response
+                # they send – hand out a fresh one around the cached body.
+                return Response(hit.body, hit.status_code, media_type=hit.media_type)
+            return hit
+
+        return wrapper
+
+    return decorator
 
 ######################################################################
 # Pydantic schemas                                                   #
@@ -147,13 +278,17 @@ class TaskIn(_ConfigMixin, BaseModel):
     project_id: int = Field(..., description="Owning project (id)")
     stage_id: int = Field(..., description="Current Kanban column (id)")
     description: Optional[str] = Field(None, description="Rich‑text HTML body")
-    date_deadline: Optional[str] = Field(
+    date_deadline: Optional[date] = Field(
         None,
-        pattern=r"^\d{4}-\d{2}-\d{2}$",
         description="Due date in YYYY‑MM‑DD format",
     )
     parent_id: Optional[int] = Field(None, description="Parent task id (for sub‑tasks)")
 
+    @field_serializer("date_deadline")
+    def _iso_deadline(self, v: Optional[date]) -> Optional[str]:
+        # Echoed responses are built from the JSON dump, i.e. already strings.
+        return v.isoformat() if isinstance(v, date) else v
+
     model_config = {"json_schema_extra": {"examples": [{
         "name": "Implement REST API",
         "project_id": 12,
@@ -168,26 +303,91 @@ class TaskOut(TaskIn):
     state: Optional[str] = Field(None, description="Internal *state* code (if any)")
 
 
+class TaskPage(BaseModel):
+    """One page of :class:`TaskOut` records (see ``GET /tasks``)."""
+
+    items: List[TaskOut] = Field(..., description="Tasks of this page")
+    limit: int = Field(..., description="Page size that was applied")
+    offset: int = Field(..., description="Number of records skipped")
+
+
 class BulkWriteIn(BaseModel):
     values: Dict[int, Dict[str, Any]] = Field(
         ..., description="Mapping {id: {field: value}} for mass updates",
         examples=[{101: {"active": False}, 102: {"stage_id": 55}}],
     )
 
+
+class BulkCreateIn(BaseModel):
+    records: List[Dict[str, Any]] = Field(
+        ..., description="One {field: value} mapping per record to create",
+        examples=[[{"name": "Draft spec", "project_id": 12}, {"name": "Review", "project_id": 12}]],
+    )
+
+
+class BulkDeleteIn(BaseModel):
+    ids: List[int] = Field(
+        ..., description="Ids of the records to unlink",
+        examples=[[101, 102, 103]],
+    )
+
+######################################################################
+# msgspec structs – hot response path of the list endpoints          #
+######################################################################
+
+class ProjectOutMS(msgspec.Struct):
+    """Wire twin of :class:`ProjectOut`, encoded by msgspec."""
+
+    id: int
+    name: str
+
+
+class TaskOutMS(msgspec.Struct):
+    """Wire twin of :class:`TaskOut`, encoded by msgspec."""
+
+    id: int
+    name: str
+    project_id: Optional[int] = None
+    stage_id: Optional[int] = None
+    description: Optional[str] = None
+    date_deadline: Optional[str] = None
+    parent_id: Optional[int] = None
+    state: Optional[str] = None
+
+
+_json_encoder = msgspec.json.Encoder()
+
+
+def _msgspec_response(objs: Any) -> Response:
+    """Encode *objs* with msgspec, bypassing FastAPI's serialisation."""
+    return Response(_json_encoder.encode(objs), media_type="application/json")
+
 ######################################################################
 # Version endpoint                                                   #
 ######################################################################
 
+# The server version only changes on redeploys – keep it for 5 minutes, keyed
+# by (url, db). The lock makes concurrent cache misses issue a single RPC.
+_version_cache: TTLCache = TTLCache(maxsize=1, ttl=300)
+_version_lock = asyncio.Lock()
+
+
 @app.get(
     "/version",
     response_model=Dict[str, str],
     summary="Return Odoo & SDK versions",
     description="Helper route so automated clients can verify both the remote "
-    "Odoo deployment and the SDK wrapper version they are talking to.",
+    "Odoo deployment and the SDK wrapper version they are talking to. The Odoo "
+    "version is cached for 5 minutes; pass `refresh=true` to re‑query it.",
 )
-def get_versions(odoo: OdooClient = Depends(get_client)):
+async def get_versions(refresh: bool = False, odoo: AsyncOdooClient = Depends(get_client)):
     """Returns a dict ``{"odoo": "...", "sdk": "..."}``."""
-    return {"odoo": odoo.version()["server_version"], "sdk": odoo.__version__}
+    key = (odoo.url, odoo.db)
+    async with _version_lock:
+        if refresh or key not in _version_cache:
+            _version_cache[key] = (await odoo.version())["server_version"]
+        server_version = _version_cache[key]
+    return {"odoo": server_version, "sdk": odoo_sdk.__version__}
 
 ######################################################################
 # Project endpoints                                                  #
@@ -196,39 +396,50 @@ def get_versions(odoo: OdooClient = Depends(get_client)):
 @app.post(
     "/projects",
     status_code=201,
-    response_model=ProjectOut,
+    response_model=None,  # echo of already-validated input – not re-validated
+    responses={201: {"model": ProjectOut}},
     summary="Create a new project",
     description="Wraps :meth:`OdooClient.create_project`. Only *name* is "
                 "required, all other fields follow Odoo defaults.",
 )
-def create_project(payload: ProjectIn, odoo: OdooClient = Depends(get_client)):
-    pid = odoo.create_project(payload.model_dump())
-    return {"id": pid, **payload.model_dump()}
+async def create_project(payload: ProjectIn, odoo: AsyncOdooClient = Depends(get_client)):
+    data = payload.model_dump()
+    pid = await odoo.create_project(data)
+    _invalidate_reads()
+    return ProjectOut.model_construct(id=pid, **data)
 
 
 @app.get(
     "/projects",
-    response_model=List[ProjectOut],
+    response_model=None,  # trusted Odoo data – documented, not re-validated
+    responses={200: {"model": List[ProjectOut]}},
     summary="List or search projects",
     description="If *name* query param is provided a case‑insensitive "
-                "substring search is performed (ILike).",
+                "substring search is performed (ILike). With "
+                "`ODOO_API_CACHE_TTL` > 0 the result is cached per process "
+                "(single‑worker deployments only).",
 )
 
-def list_projects(name: Optional[str] = None, odoo: OdooClient = Depends(get_client)):
+@cached_endpoint()
+async def list_projects(name: Optional[str] = None, odoo: AsyncOdooClient = Depends(get_client)):
     dom = [["name", "ilike", name]] if name else []
-    return odoo.search_read("project.project", dom, fields=["id", "name"])
+    raw = await odoo.search_read("project.project", dom, fields=["id", "name"])
+    return _msgspec_response(msgspec.convert(raw, List[ProjectOutMS]))
 
 
 @app.put(
     "/projects/{project_id}",
-    response_model=ProjectOut,
+    response_model=None,
+    responses={200: {"model": ProjectOut}},
     summary="Update a project",
 )
 
-def update_project(project_id: int, payload: ProjectIn, odoo: OdooClient = Depends(get_client)):
-    if not odoo.update_project(project_id, payload.model_dump()):
+async def update_project(project_id: int, payload: ProjectIn, odoo: AsyncOdooClient = Depends(get_client)):
+    data = payload.model_dump()
+    if not await odoo.update_project(project_id, data):
         raise HTTPException(404, "Project not found")
-    return {"id": project_id, **payload.model_dump()}
+    _invalidate_reads()
+    return ProjectOut.model_construct(id=project_id, **data)
 
 
 @app.patch(
@@ -238,8 +449,9 @@ def update_project(project_id: int, payload: ProjectIn, odoo: OdooClient = Depen
                 "of unlinking – this keeps analytic lines & timesheets safe.",
 )
 
-def archive_project(project_id: int, active: bool = False, odoo: OdooClient = Depends(get_client)):
-    odoo.archive_project(project_id, active=active)
+async def archive_project(project_id: int, active: bool = False, odoo: AsyncOdooClient = Depends(get_client)):
+    await odoo.archive_project(project_id, active=active)
+    _invalidate_reads()
     return {"id": project_id, "active": active}
 
 
@@ -251,9 +463,10 @@ def archive_project(project_id: int, active: bool = False, odoo: OdooClient = De
                 "linked tasks first, or Odoo will raise a constraint error.",
 )
 
-def delete_project(project_id: int, odoo: OdooClient = Depends(get_client)):
-    if not odoo.delete_project(project_id):
+async def delete_project(project_id: int, odoo: AsyncOdooClient = Depends(get_client)):
+    if not await odoo.delete_project(project_id):
         raise HTTPException(404, "Project not found")
+    _invalidate_reads()
 
 ######################################################################
 # Stage endpoints                                                    #
@@ -262,33 +475,38 @@ def delete_project(project_id: int, odoo: OdooClient = Depends(get_client)):
 @app.post(
     "/projects/{project_id}/stages",
     status_code=201,
-    response_model=StageOut,
+    response_model=None,
+    responses={201: {"model": StageOut}},
     summary="Add a Kanban column to a project",
     description="Wrapper around :meth:`OdooClient.create_stage`. Pass the "
                 "canonical *sequence* value expected by Odoo (10, 20, 30…).",
 )
 
-def create_stage(project_id: int, payload: StageIn, odoo: OdooClient = Depends(get_client)):
+async def create_stage(project_id: int, payload: StageIn, odoo: AsyncOdooClient = Depends(get_client)):
     data = payload.model_dump()
-    sid = odoo.create_stage(
+    sid = await odoo.create_stage(
         project_id,
         name=data["name"],
         seq=data["sequence"],
         fold=data["fold"],
     )
-    return {"id": sid, **data}
+    _invalidate_reads()
+    return StageOut.model_construct(id=sid, **data)
 
 
 @app.put(
     "/stages/{stage_id}",
-    response_model=StageOut,
+    response_model=None,
+    responses={200: {"model": StageOut}},
     summary="Update a Kanban column",
 )
 
-def update_stage(stage_id: int, payload: StageIn, odoo: OdooClient = Depends(get_client)):
-    if not odoo.update_stage(stage_id, payload.model_dump()):
+async def update_stage(stage_id: int, payload: StageIn, odoo: AsyncOdooClient = Depends(get_client)):
+    data = payload.model_dump()
+    if not await odoo.update_stage(stage_id, data):
         raise HTTPException(404, "Stage not found")
-    return {"id": stage_id, **payload.model_dump()}
+    _invalidate_reads()
+    return StageOut.model_construct(id=stage_id, **data)
 
 
 @app.patch(
@@ -296,8 +514,9 @@ def update_stage(stage_id: int, payload: StageIn, odoo: OdooClient = Depends(get
     summary="Archive / restore a column",
 )
 
-def archive_stage(stage_id: int, active: bool = False, odoo: OdooClient = Depends(get_client)):
-    odoo.archive_stage(stage_id, active=active)
+async def archive_stage(stage_id: int, active: bool = False, odoo: AsyncOdooClient = Depends(get_client)):
+    await odoo.archive_stage(stage_id, active=active)
+    _invalidate_reads()
     return {"id": stage_id, "active": active}
 
 
@@ -307,9 +526,10 @@ def archive_stage(stage_id: int, active: bool = False, odoo: OdooClient = Depend
     summary="Hard‑delete a column",
 )
 
-def delete_stage(stage_id: int, odoo: OdooClient = Depends(get_client)):
-    if not odoo.delete_stage(stage_id):
+async def delete_stage(stage_id: int, odoo: AsyncOdooClient = Depends(get_client)):
+    if not await odoo.delete_stage(stage_id):
         raise HTTPException(404, "Stage not found")
+    _invalidate_reads()
 
 ######################################################################
 # Task endpoints                                                     #
@@ -318,49 +538,78 @@ def delete_stage(stage_id: int, odoo: OdooClient = Depends(get_client)):
 @app.post(
     "/tasks",
     status_code=201,
-    response_model=TaskOut,
+    response_model=None,  # echo of already-validated input – not re-validated
+    responses={201: {"model": TaskOut}},
     summary="Create a task (or sub‑task)",
     description="All fields map 1‑to‑1 to the SDK helper. To create a sub‑task "
                 "simply set *parent_id* to the parent task id.",
 )
 
-def create_task(payload: TaskIn, odoo: OdooClient = Depends(get_client)):
-    tid = odoo.create_task(payload.model_dump())
-    return {"id": tid, **payload.model_dump()}
+async def create_task(payload: TaskIn, odoo: AsyncOdooClient = Depends(get_client)):
+    data = payload.model_dump(mode="json")
+    tid = await odoo.create_task(data)
+    _invalidate_reads()
+    return TaskOut.model_construct(id=tid, **data)
+
+
+_TASK_FIELDS = [
+    "id", "name", "project_id", "stage_id",
+    "state", "parent_id", "date_deadline",
+]
 
 
 @app.get(
     "/tasks",
-    response_model=List[TaskOut],
+    response_model=None,  # trusted Odoo data – documented, not re-validated
+    responses={200: {"model": TaskPage}},
     summary="Search / list tasks",
     description="Optional query param *project_id* restricts the result set. "
-                "Data are normalised so M2O fields are plain integers and "
-                "dates are truncated to `YYYY‑MM‑DD`.",
+                "Results are paginated with *limit* / *offset* and wrapped in "
+                "`{items, limit, offset}`; *fields* (comma‑separated) trims "
+                "each record to the columns you need. Data are normalised so "
+                "M2O fields are plain integers and dates are truncated to "
+                "`YYYY‑MM‑DD`. With `ODOO_API_CACHE_TTL` > 0 the result is "
+                "cached per process (single‑worker deployments only).",
 )
 
-def list_tasks(project_id: Optional[int] = None, odoo: OdooClient = Depends(get_client)):
+@cached_endpoint()
+async def list_tasks(
+    project_id: Optional[int] = None,
+    limit: int = Query(200, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    fields: Optional[str] = Query(None, description="Comma‑separated field names, e.g. `name,stage_id`"),
+    odoo: AsyncOdooClient = Depends(get_client),
+):
     dom = [["project_id", "=", project_id]] if project_id else []
-    raw = odoo.search_read(
+    wanted = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+    raw = await odoo.search_read(
         "project.task",
         dom,
-        fields=[
-            "id", "name", "project_id", "stage_id",
-            "state", "parent_id", "date_deadline",
-        ],
+        fields=wanted or _TASK_FIELDS,
+        limit=limit,
+        offset=offset,
     )
-    return [_normalize_task(r) for r in raw]
+    if wanted:
+        keep = {"id", *wanted}
+        items: Any = [{k: v for k, v in r.items() if k in keep} for r in _normalize_tasks(raw)]
+    else:
+        items = msgspec.convert(_normalize_tasks(raw), List[TaskOutMS])
+    return _msgspec_response({"items": items, "limit": limit, "offset": offset})
 
 
 @app.put(
     "/tasks/{task_id}",
-    response_model=TaskOut,
+    response_model=None,
+    responses={200: {"model": TaskOut}},
     summary="Update a task",
 )
 
-def update_task(task_id: int, payload: TaskIn, odoo: OdooClient = Depends(get_client)):
-    if not odoo.update_task(task_id, payload.model_dump()):
+async def update_task(task_id: int, payload: TaskIn, odoo: AsyncOdooClient = Depends(get_client)):
+    data = payload.model_dump(mode="json")
+    if not await odoo.update_task(task_id, data):
         raise HTTPException(404, "Task not found")
-    return {"id": task_id, **payload.model_dump()}
+    _invalidate_reads()
+    return TaskOut.model_construct(id=task_id, **data)
 
 
 @app.patch(
@@ -372,8 +621,9 @@ def update_task(task_id: int, payload: TaskIn, odoo: OdooClient = Depends(get_cl
                 "internal code, if present.",
 )
 
-def move_task(task_id: int, stage_id: int, state_label: Optional[str] = None, odoo: OdooClient = Depends(get_client)):
-    odoo.move_task(task_id, stage_id, state_label=state_label)
+async def move_task(task_id: int, stage_id: int, state_label: Optional[str] = None, odoo: AsyncOdooClient = Depends(get_client)):
+    await odoo.move_task(task_id, stage_id, state_label=state_label)
+    _invalidate_reads()
     return {"task_id": task_id, "stage_id": stage_id, "state_label": state_label}
 
 
@@ -383,9 +633,10 @@ def move_task(task_id: int, stage_id: int, state_label: Optional[str] = None, od
     summary="Hard‑delete a task",
 )
 
-def delete_task(task_id: int, odoo: OdooClient = Depends(get_client)):
-    if not odoo.delete_task(task_id):
+async def delete_task(task_id: int, odoo: AsyncOdooClient = Depends(get_client)):
+    if not await odoo.delete_task(task_id):
         raise HTTPException(404, "Task not found")
+    _invalidate_reads()
 
 ######################################################################
 # Attachment endpoints                                               #
@@ -395,15 +646,19 @@ def delete_task(task_id: int, odoo: OdooClient = Depends(get_client)):
     "/tasks/{task_id}/attachments",
     status_code=201,
     summary="Attach a file to a task",
-    description="Uses :py:meth:`OdooClient.attach_file`. The uploaded stream is "
-                "stored in /tmp only for the duration of the request.",
+    description="Uses :py:meth:`OdooClient.attach_stream`. The upload is "
+                "base64‑encoded chunk by chunk straight into the RPC payload – "
+                "nothing is written to disk.",
 )
 
-def upload_attachment(task_id: int, file: UploadFile = File(...), odoo: OdooClient = Depends(get_client)):
-    tmp = Path(f"/tmp/{file.filename}")
-    tmp.write_bytes(file.file.read())
-    aid = odoo.attach_file(task_id, tmp)
-    tmp.unlink(missing_ok=True)
+async def upload_attachment(task_id: int, file: UploadFile = File(...), odoo: AsyncOdooClient = Depends(get_client)):
+    aid = await odoo.attach_stream(
+        task_id,
+        file.filename or "upload",
+        _iter_upload(file),
+        mimetype=file.content_type,
+    )
+    _invalidate_reads()
     return {"attachment_id": aid}
 
 
@@ -412,21 +667,67 @@ def upload_attachment(task_id: int, file: UploadFile = File(...), odoo: OdooClie
     summary="List attachments for a task",
 )
 
-def list_task_attachments(task_id: int, odoo: OdooClient = Depends(get_client)):
-    return odoo.list_attachments("project.task", task_id)
+@cached_endpoint()
+async def list_task_attachments(task_id: int, odoo: AsyncOdooClient = Depends(get_client)):
+    return await odoo.list_attachments("project.task", task_id)
 
 ######################################################################
-# Bulk‑write endpoint                                                #
+# Bulk endpoints                                                     #
 ######################################################################
 
 @app.post(
     "/bulk/{model}",
-    summary="Mass‑update any model via *execute_batch*",
+    summary="Mass‑update any model",
     description="The path parameter *model* must be the technical model name "
                 "(e.g. `project.task`). The body maps record ids to the field "
-                "values you want to write. Runs in a single RPC round‑trip.",
+                "values you want to write. Records sharing the same values are "
+                "written with one multi‑id `write`.",
+)
+
+async def bulk_write(model: str, body: BulkWriteIn, odoo: AsyncOdooClient = Depends(get_client)):
+    await odoo.bulk_write(model, body.values)
+    _invalidate_reads()
+    return {"updated": len(body.values)}
+
+
+@app.post(
+    "/bulk-create/{model}",
+    status_code=201,
+    summary="Mass‑create records of any model",
+    description="Creates every record of the body with a single `create` RPC "
+                "round‑trip (Odoo's multi‑create). The returned *ids* follow "
+                "the order of *records*.",
 )
 
-def bulk_write(model: str, body: BulkWriteIn, odoo: OdooClient = Depends(get_client)):
-    result = odoo.bulk_write(model, body.values)
-    return {"updated": len(result)}
+async def bulk_create(model: str, body: BulkCreateIn, odoo: AsyncOdooClient = Depends(get_client)):
+    ids = await odoo.execute_kw(model, "create", body.records)
+    _invalidate_reads()
+    return {"ids": ids}
+
+
+@app.post(
+    "/bulk-delete/{model}",
+    summary="Mass‑delete records of any model",
+    description="Hard‑deletes every id listed in the body with a single "
+                "`unlink` RPC round‑trip. *model* is the technical model name "
+                "(e.g. `project.task`); Odoo's own constraints still apply.",
+)
+
+async def bulk_delete(model: str, body: BulkDeleteIn, odoo: AsyncOdooClient = Depends(get_client)):
+    if not await odoo.delete(model, body.ids):
+        raise HTTPException(404, "Records not found")
+    _invalidate_reads()
+    return {"deleted": len(body.ids)}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "odoo_api:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8777")),
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+    )
@@ -6,25 +6,27 @@ Cosa fa
 -------
 1. POST /projects                     → crea progetto Scrum
 2. POST /projects/{id}/stages         → crea 4 colonne
-3. POST /tasks                        → crea task & sotto-task
+3. POST /bulk-create/project.task     → crea task (1 chiamata) e sotto-task (1)
 4. PATCH /tasks/{id}/move             → sposta il task padre a *Done*
 5. GET  /tasks?project_id=…           → riepilogo
+   (le chiamate indipendenti partono in parallelo con `asyncio.gather`)
 6. Pulizia interattiva:
    • GET  /projects?name=…            → trova progetti omonimi
-   • DELETE /tasks/{id}               → elimina i task
-   • DELETE /stages/{id}              → elimina le colonne
+   • POST /bulk-delete/project.task   → elimina i task (una sola RPC)
+   • POST /bulk-delete/project.task.type → elimina le colonne
    • DELETE /projects/{id}            → elimina il progetto
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from datetime import date, timedelta
 from pprint import pprint
 from typing import Dict, List
 
-import requests
+import httpx
 
 API_BASE = "http://34.13.153.241:8777"         # <-- gateway FastAPI
 PROJECT_NAME = "SDK v0.4 Demo (REST)"
@@ -33,15 +35,14 @@ logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
 
 # --------------------------------------------------------------------------- #
-# Helper di basso livello – thin wrapper su requests                          #
+# Helper di basso livello – thin wrapper su httpx.AsyncClient                 #
 # --------------------------------------------------------------------------- #
 
-def api(method: str, path: str, **kwargs):
+async def api(client: httpx.AsyncClient, method: str, path: str, **kwargs):
     """Esegue una chiamata HTTP e restituisce JSON (o lancia eccezione)."""
-    url = f"{API_BASE}{path}"
-    resp = requests.request(method, url, timeout=30, **kwargs)
-    if not resp.ok:
-        raise RuntimeError(f"{method} {url} -> {resp.status_code} {resp.text}")
+    resp = await client.request(method, path, **kwargs)
+    if resp.is_error:
+        raise RuntimeError(f"{method} {resp.request.url} -> {resp.status_code} {resp.text}")
     if resp.content:
         return resp.json()
     return None
@@ -51,92 +52,100 @@ def api(method: str, path: str, **kwargs):
 # Utilities                                                                   #
 # --------------------------------------------------------------------------- #
 
+# Template pre-renderizzato, senza indentazione: solo il titolo cambia.
+_HTML_TPL = (
+    "<h3>{title}</h3>"
+    "<p>Tracked via <strong>REST-demo workflow</strong>.</p>"
+    '<table border="1" cellpadding="4" cellspacing="0">'
+    "<tr><th>Status</th><td>Draft</td></tr>"
+    "<tr><th>Owner</th><td>API-Bot</td></tr>"
+    "</table>"
+)
+
+
 def html_description(title: str) -> str:
-    return f"""
-    <h3>{title}</h3>
-    <p>Tracked via <strong>REST-demo workflow</strong>.</p>
-    <table border="1" cellpadding="4" cellspacing="0">
-        <tr><th>Status</th><td>Draft</td></tr>
-        <tr><th>Owner</th><td>API-Bot</td></tr>
-    </table>
-    """
+    return _HTML_TPL.replace("{title}", title)
 
 
 # --------------------------------------------------------------------------- #
 # 1) Creazione dati demo                                                      #
 # --------------------------------------------------------------------------- #
 
-def create_demo_data() -> None:
+async def create_demo_data(client: httpx.AsyncClient) -> None:
     # -- Progetto
-    prj = api("post", "/projects", json={"name": PROJECT_NAME})
+    prj = await api(client, "post", "/projects", json={"name": PROJECT_NAME})
     project_id = prj["id"]
     logging.info("Created project %s", project_id)
 
-    # -- Colonne Scrum
-    stage_ids: Dict[str, int] = {}
-    for seq, name in enumerate(["Backlog", "To Do", "In Progress", "Done"], 1):
-        st = api(
+    # -- Colonne Scrum (in parallelo)
+    names = ["Backlog", "To Do", "In Progress", "Done"]
+    stages = await asyncio.gather(*(
+        api(
+            client,
             "post",
             f"/projects/{project_id}/stages",
             json={"name": name, "sequence": seq, "fold": name == "Done"},
         )
+        for seq, name in enumerate(names, 1)
+    ))
+    stage_ids: Dict[str, int] = {}
+    for name, st in zip(names, stages):
         stage_ids[name] = st["id"]
         logging.info("  Stage %-12s → %s", name, st["id"])
 
-    # -- Task principali
+    # -- Task principali: parent + fratelli in un'unica bulk-create
     today = date.today()
-    parent = api(
-        "post",
-        "/tasks",
-        json={
-            "name": "Implement SDK core",
-            "project_id": project_id,
-            "stage_id": stage_ids["In Progress"],
-            "description": html_description("Implement SDK core"),
-            "date_deadline": (today + timedelta(days=10)).isoformat(),
-        },
-    )["id"]
-    logging.info("Parent task id=%s", parent)
-
-    others = [
+    tasks_spec = [
+        ("Implement SDK core", "In Progress", 10),
         ("Define requirements", "Backlog", 5),
         ("Set up repository", "To Do", 3),
         ("Write documentation", "To Do", 12),
         ("Quality assurance", "In Progress", 14),
         ("Release v1.0", "Done", 15),
     ]
-    for name, col, delta in others:
-        t = api(
-            "post",
-            "/tasks",
-            json={
+    parent, *task_ids = (await api(
+        client,
+        "post",
+        "/bulk-create/project.task",
+        json={"records": [
+            {
                 "name": name,
                 "project_id": project_id,
                 "stage_id": stage_ids[col],
                 "description": html_description(name),
                 "date_deadline": (today + timedelta(days=delta)).isoformat(),
-            },
-        )
-        logging.info("  Task '%s' (id=%s → %s)", name, t["id"], col)
+            }
+            for name, col, delta in tasks_spec
+        ]},
+    ))["ids"]
+    logging.info("Parent task id=%s", parent)
+    for (name, col, _), tid in zip(tasks_spec[1:], task_ids):
+        logging.info("  Task '%s' (id=%s → %s)", name, tid, col)
 
-    # -- Sotto-task del parent
-    for sub in ["REST wrapper", "CLI utility", "Unit tests"]:
-        st = api(
-            "post",
-            "/tasks",
-            json={
+    # -- Sotto-task del parent (dipendono solo dal suo id) – seconda bulk-create
+    subs = ["REST wrapper", "CLI utility", "Unit tests"]
+    sub_ids = (await api(
+        client,
+        "post",
+        "/bulk-create/project.task",
+        json={"records": [
+            {
                 "name": sub,
                 "parent_id": parent,
                 "project_id": project_id,
                 "stage_id": stage_ids["In Progress"],
                 "description": html_description(sub),
                 "date_deadline": (today + timedelta(days=7)).isoformat(),
-            },
-        )
-        logging.info("    Sub-task '%s' (id=%s)", sub, st["id"])
+            }
+            for sub in subs
+        ]},
+    ))["ids"]
+    for sub, stid in zip(subs, sub_ids):
+        logging.info("    Sub-task '%s' (id=%s)", sub, stid)
 
     # -- Sposta parent a Done (e prova a settare state=Done)
-    api(
+    await api(
+        client,
         "patch",
         f"/tasks/{parent}/move",
         params={"stage_id": stage_ids["Done"], "state_label": "Done"},
@@ -144,7 +153,7 @@ def create_demo_data() -> None:
     logging.info("Moved parent task → Done")
 
     # -- Riepilogo
-    tasks = api("get", "/tasks", params={"project_id": project_id})
+    tasks = (await api(client, "get", "/tasks", params={"project_id": project_id}))["items"]
     print("\nTasks summary:")
     pprint(tasks)
 
@@ -153,8 +162,8 @@ def create_demo_data() -> None:
 # 2) Pulizia interattiva                                                      #
 # --------------------------------------------------------------------------- #
 
-def interactive_cleanup() -> None:
-    projs = api("get", "/projects", params={"name": PROJECT_NAME})
+async def interactive_cleanup(client: httpx.AsyncClient) -> None:
+    projs = await api(client, "get", "/projects", params={"name": PROJECT_NAME})
     if not projs:
         print("\nNessun progetto da eliminare.")
         return
@@ -163,13 +172,16 @@ def interactive_cleanup() -> None:
     for p in projs:
         print(f"  • ID {p['id']}")
 
-    for p in projs:
+    # legge i task di tutti i progetti in parallelo
+    all_tasks = await asyncio.gather(*(
+        api(client, "get", "/tasks", params={"project_id": p["id"], "limit": 1000}) for p in projs
+    ))
+
+    for p, page in zip(projs, all_tasks):
         pid = p["id"]
-        # legge task e colonne
-        tasks = api("get", "/tasks", params={"project_id": pid})
-        stages = api("get", f"/projects/{pid}/stages") if hasattr(requests, "dummy") else []  # placeholder se non esposto
+        stages: List[dict] = []  # placeholder: nessun endpoint GET per le colonne
 
-        task_ids = [t["id"] for t in tasks]
+        task_ids = [t["id"] for t in page["items"]]
         stage_ids = [s["id"] for s in stages] if stages else []
 
         print(f"\n===> Eliminare progetto {pid}?")
@@ -179,11 +191,11 @@ def interactive_cleanup() -> None:
             print("  » salto.")
             continue
 
-        for tid in task_ids:
-            api("delete", f"/tasks/{tid}")
-        for sid in stage_ids:
-            api("delete", f"/stages/{sid}")
-        api("delete", f"/projects/{pid}")
+        if task_ids:
+            await api(client, "post", "/bulk-delete/project.task", json={"ids": task_ids})
+        if stage_ids:
+            await api(client, "post", "/bulk-delete/project.task.type", json={"ids": stage_ids})
+        await api(client, "delete", f"/projects/{pid}")
         print("  ✔ eliminato.")
 
 
@@ -191,10 +203,18 @@ def interactive_cleanup() -> None:
 # main                                                                        #
 # --------------------------------------------------------------------------- #
 
-def main() -> None:
-    create_demo_data()
-    interactive_cleanup()
+async def main() -> None:
+    # Un solo client (pool keep-alive) per tutta la demo; HTTP/2 viene
+    # negoziato quando il gateway è esposto in HTTPS.
+    async with httpx.AsyncClient(
+        base_url=API_BASE,
+        http2=True,
+        timeout=30,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+    ) as client:
+        await create_demo_data(client)
+        await interactive_cleanup(client)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
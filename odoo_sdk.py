@@ -6,14 +6,19 @@ manipulate Odoo data programmatically.
 
 Highlights
 ~~~~~~~~~~
-* **Single dependency:** only `requests`.
+* **Single dependency:** only `requests` (plus optional `httpx` for the
+  asyncio flavour :class:`AsyncOdooClient` and optional `orjson` for faster
+  (de)serialisation of large payloads).
 * **Context-manager** support ⇒ automatic `authenticate()` on `__enter__`.
 * **Extensive docstrings & type-hints** ready for IDE / LSP autocompletion.
 * **Generic CRUD**, **metadata** helpers (`fields_get`, selections),
   **batch execute**, and convenience wrappers for **Project** / **Task**
   workflows (create sub-task, move task, attach files, etc.).
-* **Safe retries** on transient HTTP errors (exponential back-off).
-* 100 % JSON-RPC compliance – no private endpoints.
+* **Safe retries** on transient HTTP errors (jittered back-off that honours
+  ``Retry-After``).
+* JSON-RPC for every model operation; only the raw attachment download
+  (:meth:`OdooClient.download_attachment`) uses the web endpoints
+  ``/web/session/authenticate`` and ``/web/content``.
 
 Example
 -------
@@ -34,18 +39,36 @@ with OdooClient(url="https://my.odoo.com/jsonrpc",
 ```
 """
 from __future__ import annotations
+import asyncio
 import base64
+import gzip
+import itertools
 import json
 import logging
 import random
-import time
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence
+from typing import Any, AsyncIterable, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple
 
-import requests
-from requests import Response, Session
+from requests import HTTPError, Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-__all__ = ["OdooClient", "RPCError", "AuthenticationError"]
+try:  # optional – only required by AsyncOdooClient
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+try:  # optional – C-accelerated JSON, falls back to the stdlib
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:  # optional – incremental JSON parsing for OdooClient.iter_search_read_stream
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None  # type: ignore[assignment]
+
+__all__ = ["OdooClient", "AsyncOdooClient", "RPCError", "AuthenticationError"]
 __version__ = "0.4.0"  # keep in sync with pyproject.toml when packaging
 
 logger = logging.getLogger(__name__)
@@ -64,6 +87,302 @@ class RPCError(RuntimeError):
 class AuthenticationError(RPCError):
     """Raised when credentials are invalid or `uid` cannot be retrieved."""
 
+# --------------------------------------------------------------------------- #
+# Transport-agnostic helpers (shared by the sync and async clients)
+# --------------------------------------------------------------------------- #
+
+if orjson is not None:
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+else:  # pragma: no cover
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_GZIP_HEADERS = {**_JSON_HEADERS, "Content-Encoding": "gzip"}
+
+
+def _encode_body(payload: Any, gzip_threshold: Optional[int]) -> Tuple[bytes, Mapping[str, str]]:
+    """Serialise *payload*; gzip it (level 1) when larger than *gzip_threshold* bytes."""
+    body = _dumps(payload)
+    if gzip_threshold is not None and len(body) > gzip_threshold:
+        return gzip.compress(body, compresslevel=1), _GZIP_HEADERS
+    return body, _JSON_HEADERS
+
+
+_rpc_ids = itertools.count(1)  # monotonic request ids; next() is atomic under the GIL
+_EMPTY: JSON = {}  # shared "no kwargs" value – only ever serialised, never mutated
+
+
+def _rpc_payload(service: str, method: str, args: Sequence[Any]) -> JSON:
+    """Build the JSON-RPC 2.0 envelope for ``service.method(*args)``."""
+    return {
+        "jsonrpc": "2.0",
+        "method": "call",
+        "params": {"service": service, "method": method, "args": list(args)},
+        "id": next(_rpc_ids),
+    }
+
+
+def _redact(value: Any) -> Any:
+    """Copy of *value* with attachment ``datas`` replaced by a short marker."""
+    if isinstance(value, dict):
+        return {
+            k: f"<base64 len={len(v)}>" if k == "datas" and isinstance(v, str) else _redact(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_redact(v) for v in value]
+    return value
+
+
+def _log_payload(payload: JSON) -> None:
+    """DEBUG-log (the head of) *payload* – serialised only when DEBUG is on."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("RPC → %s", json.dumps(_redact(payload), default=str)[:500])
+
+
+def _rpc_result(resp: JSON) -> Any:
+    """Unwrap a decoded JSON-RPC response or raise :class:`RPCError`."""
+    if "error" in resp:
+        logger.error("RPC error: %s", resp["error"])
+        raise RPCError(resp["error"])
+    return resp.get("result")
+
+
+_RETRY_STATUS = frozenset({429, 502, 503, 504})
+_BACKOFF_BASE = 0.25  # seconds
+_BACKOFF_CAP = 8.0
+
+
+def _retry_delay(prev: float, retry_after: str | None) -> float:
+    """Decorrelated-jitter back-off, never shorter than the server's ``Retry-After``."""
+    try:
+        floor = float(retry_after) if retry_after else 0.0
+    except ValueError:  # HTTP-date form – rely on the jitter alone
+        floor = 0.0
+    return max(floor, min(_BACKOFF_CAP, random.uniform(_BACKOFF_BASE, prev * 3)))
+
+
+class _JitterRetry(Retry):
+    """``urllib3`` retry policy using the decorrelated jitter of :func:`_retry_delay`.
+
+    ``Retry-After`` (429/503) is honoured by urllib3 itself; the jittered delay
+    is carried from one attempt to the next through :meth:`new`.
+    """
+
+    _prev: float = _BACKOFF_BASE
+
+    def new(self, **kw: Any) -> "_JitterRetry":
+        retry = super().new(**kw)
+        retry._prev = self._prev
+        return retry
+
+    def get_backoff_time(self) -> float:
+        self._prev = _retry_delay(self._prev, None)
+        return self._prev
+
+
+def _state_code(selection: Mapping[str, str], label: str) -> Optional[str]:
+    """Return the selection *code* whose label matches *label* (case-insensitive)."""
+    return next((c for c, lbl in selection.items() if lbl.lower() == label.lower()), None)
+
+
+class _B64Encoder:
+    """Incremental base64 encoder – ``feed`` arbitrary chunks, then ``getvalue``.
+
+    Chunks are split on 3-byte boundaries so the concatenated output equals
+    ``base64.b64encode(b"".join(chunks))`` without ever holding the raw file.
+    """
+
+    def __init__(self) -> None:
+        self._parts: List[bytes] = []
+        self._rest = b""
+
+    def feed(self, chunk: bytes) -> None:
+        buf = self._rest + chunk if self._rest else chunk
+        cut = len(buf) - len(buf) % 3
+        self._parts.append(base64.b64encode(buf[:cut]))
+        self._rest = buf[cut:]
+
+    def getvalue(self) -> str:
+        return b"".join([*self._parts, base64.b64encode(self._rest)]).decode("ascii")
+
+
+_FILE_CHUNK = 48 * 1024  # multiple of 3 – every chunk encodes without padding
+
+
+def _b64_file(path: Path) -> str:
+    """Base64 of the file at *path*, read in ``_FILE_CHUNK`` slices."""
+    enc = _B64Encoder()
+    with path.open("rb") as fh:
+        for chunk in iter(lambda: fh.read(_FILE_CHUNK), b""):
+            enc.feed(chunk)
+    return enc.getvalue()
+
+
+def _search_read_opts(fields: Sequence[str] | None, offset: int, limit: int | None, order: str | None) -> JSON:
+    """``search_read`` keyword arguments, omitting the server defaults.
+
+    ``fields=[]`` is kept (Odoo reads it as *all fields*, like ``None``).
+    """
+    opts: JSON = {}
+    if fields is not None:
+        opts["fields"] = list(fields)
+    if offset:
+        opts["offset"] = offset
+    if limit is not None:
+        opts["limit"] = limit
+    if order:
+        opts["order"] = order
+    return opts
+
+
+def _attachment_values(res_id: int, name: str, datas: str, model: str, mimetype: str | None) -> JSON:
+    """Values for an ``ir.attachment`` ``create`` call."""
+    return {
+        "name": name,
+        "datas": datas,
+        "res_model": model,
+        "res_id": res_id,
+        "mimetype": mimetype or "application/octet-stream",
+    }
+
+
+def _vals_key(vals: JSON) -> str:
+    """Order-independent, *type-aware* identity of a ``write`` values dict.
+
+    JSON keeps ``true``/``1``/``1.0`` and ``false``/``0`` apart (a tuple key
+    would not: ``True == 1 == 1.0``) and copes with nested command lists.
+    """
+    return json.dumps(vals, sort_keys=True, default=str)
+
+
+def _bulk_write_groups(id_vals_map: Mapping[int, JSON]) -> List[Tuple[List[int], JSON]]:
+    """Group ``{id: vals}`` into ``(ids, vals)`` pairs, one per distinct *vals*.
+
+    Records sharing the same values become one multi-id ``write``; groups keep
+    the order in which their values first appear.
+    """
+    groups: Dict[str, Tuple[List[int], JSON]] = {}
+    for rid, vals in id_vals_map.items():
+        groups.setdefault(_vals_key(vals), ([], vals))[0].append(rid)
+    return list(groups.values())
+
+
+class _Future:
+    """Placeholder returned by :meth:`OdooClient.batch` helpers.
+
+    Resolved when the batch is flushed; :meth:`result` returns the value (or
+    re-raises the per-call :class:`RPCError`).
+    """
+
+    __slots__ = ("_done", "_value", "_exc")
+
+    def __init__(self) -> None:
+        self._done = False
+        self._value: Any = None
+        self._exc: Optional[BaseException] = None
+
+    def _set(self, resp: JSON) -> None:
+        try:
+            self._value = _rpc_result(resp)
+        except RPCError as exc:
+            self._exc = exc
+        self._done = True
+
+    def done(self) -> bool:
+        return self._done
+
+    def result(self) -> Any:
+        if not self._done:
+            raise RuntimeError("Batch not flushed yet – leave the `with odoo.batch()` block first")
+        if self._exc is not None:
+            raise self._exc
+        return self._value
+
+
+class _GatherFuture(_Future):
+    """Future over several queued calls (``execute_batch`` inside a batch)."""
+
+    __slots__ = ("_parts",)
+
+    def __init__(self, parts: Sequence[_Future]) -> None:
+        super().__init__()
+        self._parts = parts
+
+    def done(self) -> bool:
+        return all(f.done() for f in self._parts)
+
+    def result(self) -> List[Any]:
+        return [f.result() for f in self._parts]
+
+
+class _BatchProxy:
+    """Stand-in for an :class:`OdooClient` that queues RPCs instead of sending them.
+
+    Every helper of the client is re-bound to the proxy, so its single RPC
+    (routed through ``_call``) lands in the queue and the helper returns a
+    :class:`_Future`. Metadata lookups (``fields_get``, ``selection_labels``)
+    and authentication stay eager because helpers need their value up-front.
+    """
+
+    _EAGER = frozenset({
+        "authenticate", "fields_get", "selection_labels", "version",
+        "iter_search_read", "batch", "_json_rpc", "_json_rpc_batch", "_post",
+        "download_attachment", "iter_attachment", "_web_login", "_login_prefix",
+        "iter_search_read_stream",
+    })
+
+    def __init__(self, client: "OdooClient") -> None:
+        self._client = client
+        self._queue: List[Tuple[str, str, Sequence[Any], JSON, _Future]] = []
+
+    def __enter__(self) -> "_BatchProxy":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(type(self._client), name, None)
+        if callable(attr) and name not in self._EAGER:
+            return attr.__get__(self)
+        return getattr(self._client, name)
+
+    # -- queueing -----------------------------------------------------------
+    def _call(self, model: str, method: str, args: Sequence[Any], kwargs: Optional[JSON] = None) -> _Future:
+        fut = _Future()
+        self._queue.append((model, method, list(args), kwargs or _EMPTY, fut))
+        return fut
+
+    def execute_kw(self, model: str, method: str, *args: Sequence[Any], **kwargs: JSON) -> _Future:
+        return self._call(model, method, args, kwargs)
+
+    def execute_batch(self, calls: Iterable[Mapping[str, Any]]) -> _GatherFuture:
+        return _GatherFuture([
+            self._call(c["model"], c["method"], c["args"], c.get("kwargs")) for c in calls
+        ])
+
+    def flush(self) -> None:
+        """Send every queued call as one JSON-RPC array and resolve the futures."""
+        queue, self._queue = self._queue, []
+        if not queue:
+            return
+        client = self._client
+        prefix = client._auth_prefix or client._login_prefix()
+        responses = client._json_rpc_batch([
+            (client._OBJECT, "execute_kw", (*prefix, model, method, args, kwargs))
+            for model, method, args, kwargs, _ in queue
+        ])
+        for (*_, fut), resp in zip(queue, responses):
+            fut._set(resp)
+
 # --------------------------------------------------------------------------- #
 # Client
 # --------------------------------------------------------------------------- #
@@ -86,7 +405,23 @@ class OdooClient:
     verify_ssl:
         Verify TLS certificates (default True).
     session:
-        Optional `requests.Session` to reuse TCP connections.
+        Optional `requests.Session` to reuse TCP connections. When omitted a
+        keep-alive session with a tuned connection pool and the SDK retry
+        policy is created; on a supplied session the SDK retry policy is
+        installed on adapters that have none (``max_retries.total == 0``),
+        custom policies are left alone.
+    pool_maxsize:
+        Pooled connections per host for the internal session (default 32) –
+        raise it when sharing the client across many threads.
+    gzip_threshold:
+        Gzip request bodies larger than this many bytes (e.g. ``16384``).
+        Off by default: the server (or the reverse proxy in front of it) must
+        decode ``Content-Encoding: gzip`` requests. Responses are always
+        requested compressed.
+    batch_url:
+        Optional JSON-RPC endpoint that accepts 2.0 batch **arrays** (e.g. a
+        fan-out proxy in front of Odoo). Required by :meth:`batch`: stock
+        Odoo's ``/jsonrpc`` only handles single requests.
     """
 
     _COMMON = "common"
@@ -103,15 +438,51 @@ class OdooClient:
         timeout: int = 30,
         verify_ssl: bool = True,
         session: Optional[Session] = None,
+        pool_maxsize: int = 32,
+        gzip_threshold: Optional[int] = None,
+        batch_url: Optional[str] = None,
     ) -> None:
         self.url = url.rstrip("/")
+        self.batch_url = batch_url.rstrip("/") if batch_url else None
         self.db = db
         self.username = username
         self.api_key = api_key
         self.timeout = timeout
         self.verify_ssl = verify_ssl
-        self._sess: Session = session or Session()
+        self.gzip_threshold = gzip_threshold
+        retry = _JitterRetry(
+            total=2,  # 3 attempts, like AsyncOdooClient
+            status_forcelist=_RETRY_STATUS,
+            allowed_methods=frozenset({"POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,  # the final 5xx surfaces via raise_for_status()
+        )
+        if session is not None:
+            # Keep the caller's pool/headers; only fill in a missing retry policy.
+            adapter = session.get_adapter(self.url)
+            if isinstance(adapter, HTTPAdapter) and adapter.max_retries.total == 0:
+                adapter.max_retries = retry
+        else:
+            session = Session()
+            adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=pool_maxsize,
+                pool_block=False,
+                max_retries=retry,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({
+                "Connection": "keep-alive",
+                "Content-Type": "application/json",
+                "Accept-Encoding": "gzip, deflate",
+            })
+        self._sess: Session = session
         self.uid: Optional[int] = None
+        self._auth_prefix: Optional[Tuple[str, int, str]] = None  # (db, uid, api_key) once authenticated
+        self._sel_cache: Dict[Tuple[str, str], Dict[str, str]] = {}
+        self._fields_cache: Dict[Tuple[str, Tuple[str, ...]], JSON] = {}
+        self._web_session = False  # session cookie for /web/content obtained?
 
     # ------------------------- context manager ------------------------------
     def __enter__(self) -> "OdooClient":
@@ -123,39 +494,86 @@ class OdooClient:
         pass
 
     # -------------------------- private helpers -----------------------------
-    def _post(self, payload: JSON) -> Response:
-        """Low-level POST with safe retry on *ConnectionError* and 502/504."""
-        for attempt in range(3):
-            try:
-                resp = self._sess.post(
-                    self.url,
-                    json=payload,
-                    timeout=self.timeout,
-                    verify=self.verify_ssl,
-                )
-                resp.raise_for_status()
-                return resp
-            except (requests.ConnectionError, requests.HTTPError) as exc:
-                if attempt == 2 or isinstance(exc, requests.HTTPError) and exc.response.status_code < 500:
-                    raise
-                wait = 2 ** attempt
-                logger.warning("Transient network error (%s) – retrying in %ss", exc, wait)
-                time.sleep(wait)
-        raise RuntimeError("Unreachable")  # pragma: no cover
+    def _post(self, payload: JSON | List[JSON], *, stream: bool = False, url: Optional[str] = None) -> Response:
+        """Low-level POST; transient failures are retried by the adapter's ``_JitterRetry``."""
+        body, headers = _encode_body(payload, self.gzip_threshold)
+        resp = self._sess.post(
+            url or self.url,
+            data=body,
+            headers=headers,
+            timeout=self.timeout,
+            verify=self.verify_ssl,
+            stream=stream,
+        )
+        resp.raise_for_status()
+        return resp
 
     def _json_rpc(self, service: str, method: str, args: Sequence[Any]) -> Any:
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "call",
-            "params": {"service": service, "method": method, "args": list(args)},
-            "id": random.randint(1, 1_000_000),
-        }
-        logger.debug("RPC → %s", json.dumps(payload, indent=2)[:500])
-        resp = self._post(payload).json()
-        if "error" in resp:
-            logger.error("RPC error: %s", resp["error"])
-            raise RPCError(resp["error"])
-        return resp.get("result")
+        payload = _rpc_payload(service, method, args)
+        _log_payload(payload)
+        return _rpc_result(_loads(self._post(payload).content))
+
+    def _json_rpc_batch(self, calls: Sequence[Tuple[str, str, Sequence[Any]]]) -> List[JSON]:
+        """POST ``(service, method, args)`` triples as one JSON-RPC 2.0 array to ``batch_url``.
+
+        Returns the raw response objects re-ordered to match *calls* (the spec
+        allows the server to answer in any order, so they are matched by id).
+        """
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "method": "call",
+                "params": {"service": service, "method": method, "args": list(args)},
+                "id": i,
+            }
+            for i, (service, method, args) in enumerate(calls)
+        ]
+        logger.debug("RPC batch → %d calls", len(payload))
+        unsupported = f"{self.batch_url} does not accept JSON-RPC batch (array) requests"
+        try:
+            data = _loads(self._post(payload, url=self.batch_url).content)
+        except HTTPError as exc:
+            if exc.response.status_code in _RETRY_STATUS:  # transient, not a rejection
+                raise
+            raise RPCError(f"{unsupported} (HTTP {exc.response.status_code})") from exc
+        if isinstance(data, dict):  # server rejected the array as a whole
+            raise RPCError(f"{unsupported}: {data.get('error', data)!r}")
+        by_id = {r.get("id"): r for r in data}
+        return [
+            by_id.get(i, {"error": {"message": f"No response for batched call #{i}"}})
+            for i in range(len(payload))
+        ]
+
+    def _call(self, model: str, method: str, args: Sequence[Any], kwargs: Optional[JSON] = None) -> Any:
+        """Single entry point of the helpers – shadowed by :meth:`batch` proxies.
+
+        The decoded JSON value is returned as-is (already a fresh list/int/bool).
+        """
+        return self.execute_kw(model, method, *args, **(kwargs or _EMPTY))
+
+    def batch(self) -> _BatchProxy:
+        """Queue helper calls and send them in **one** round-trip.
+
+        Example
+        -------
+        >>> with odoo.batch() as b:
+        ...     t1 = b.create_task({"name": "A", "project_id": prj})
+        ...     ok = b.update_task(42, {"priority": "1"})
+        >>> t1.result(), ok.result()
+        (57, True)
+
+        Inside the block every helper returns a future; the queue is flushed on
+        a clean exit (and discarded if the block raises). Helpers whose later
+        RPCs depend on earlier results (e.g. ``iter_search_read``) run eagerly.
+
+        **Opt-in:** the flush POSTs a JSON-RPC 2.0 *array*, which Odoo's own
+        ``/jsonrpc`` rejects, so the client must be built with ``batch_url=``
+        pointing at an array-capable endpoint. On a plain server use
+        multi-record ``create``/``write``/``unlink`` (ids lists) instead.
+        """
+        if not self.batch_url:
+            raise RuntimeError("batch() needs an array-capable endpoint – pass batch_url= to OdooClient")
+        return _BatchProxy(self)
 
     # --------------------------- core methods -------------------------------
     def authenticate(self) -> int:
@@ -174,56 +592,77 @@ class OdooClient:
         if not isinstance(result, int):
             raise AuthenticationError(result)
         self.uid = result
+        self._auth_prefix = (self.db, result, self.api_key)
         logger.info("Authenticated uid=%s", self.uid)
         return result
 
     def execute_kw(self, model: str, method: str, *args: Sequence[Any], **kwargs: JSON) -> Any:
         """Thin wrapper around ``object.execute_kw`` with auto-auth."""
-        if self.uid is None:
-            self.authenticate()
-        rpc_args = [self.db, self.uid, self.api_key, model, method, list(args), kwargs or {}]
-        return self._json_rpc(self._OBJECT, "execute_kw", rpc_args)
+        prefix = self._auth_prefix or self._login_prefix()
+        return self._json_rpc(self._OBJECT, "execute_kw", (*prefix, model, method, list(args), kwargs or _EMPTY))
+
+    def _login_prefix(self) -> Tuple[str, int, str]:
+        """Lazy authentication for the first RPC (``__enter__`` does it up-front)."""
+        self.authenticate()
+        return self._auth_prefix  # type: ignore[return-value]
 
     # ----------------------------- utilities --------------------------------
     def fields_get(self, model: str, attributes: Sequence[str] | None = None) -> JSON:
-        """Return metadata for *model* (uses ``fields_get``)."""
-        return self.execute_kw(model, "fields_get", [], attributes=attributes or [])
+        """Return metadata for *model* (uses ``fields_get``).
+
+        Cached per client and per attribute set – treat the result as read-only.
+        """
+        key = (model, tuple(sorted(attributes or [])))
+        if key not in self._fields_cache:
+            self._fields_cache[key] = self.execute_kw(model, "fields_get", [], attributes=list(key[1]))
+        return self._fields_cache[key]
 
     def selection_labels(self, model: str, field: str) -> Dict[str, str]:
-        """Return a mapping *code → label* for a *selection* field."""
-        meta = self.fields_get(model, attributes=["selection"])
-        return dict(meta[field]["selection"])  # type: ignore[index]
+        """Return a mapping *code → label* for a *selection* field.
+
+        Selections are schema-level, so the result is cached per client until
+        :meth:`clear_metadata_cache` (e.g. after installing a module).
+        """
+        key = (model, field)
+        if key not in self._sel_cache:
+            meta = self.fields_get(model, attributes=["selection"])
+            self._sel_cache[key] = dict(meta[field]["selection"])  # type: ignore[index]
+        return self._sel_cache[key]
+
+    def clear_metadata_cache(self, model: str | None = None) -> None:
+        """Drop cached field metadata (of *model* only, if given) so the next
+        lookup hits the server."""
+        if model is None:
+            self._sel_cache.clear()
+            self._fields_cache.clear()
+            return
+        for cache in (self._sel_cache, self._fields_cache):
+            for key in [k for k in cache if k[0] == model]:
+                del cache[key]
 
     # ----------------------- generic CRUD wrappers --------------------------
-    def create(self, model: str, values: JSON) -> int:
-        return int(self.execute_kw(model, "create", values))
+    def create(self, model: str, values: JSON | Sequence[JSON]) -> int | List[int]:
+        """Create one record (dict → id) or many (list of dicts → ids, same order)."""
+        return self._call(model, "create", [values])
 
     def read(self, model: str, ids: Sequence[int], fields: Sequence[str] | None = None) -> List[JSON]:
-        return list(self.execute_kw(model, "read", ids, fields or []))
+        return self._call(model, "read", [ids, fields or []])
 
     def update(self, model: str, ids: Sequence[int], values: JSON) -> bool:
-        return bool(self.execute_kw(model, "write", ids, values))
+        return self._call(model, "write", [ids, values])
 
     def delete(self, model: str, ids: Sequence[int]) -> bool:
-        return bool(self.execute_kw(model, "unlink", ids))
+        return self._call(model, "unlink", [ids])
 
     def search(self, model: str, domain: Domain | None = None, *, offset: int = 0, limit: int | None = None, order: str | None = None) -> List[int]:
-        return list(self.execute_kw(model, "search", domain or [], offset, limit, order))
+        return self._call(model, "search", [domain or [], offset, limit, order])
 
     def search_read(self, model: str, domain: Domain | None = None, *, fields: Sequence[str] | None = None, offset: int = 0, limit: int | None = None, order: str | None = None) -> List[JSON]:
-        opts: JSON = {}
-        if fields is not None:
-            opts["fields"] = list(fields)
-        if offset:
-            opts["offset"] = offset
-        if limit is not None:
-            opts["limit"] = limit
-        if order:
-            opts["order"] = order
-        return list(self.execute_kw(model, "search_read", domain or [], **opts))
+        opts = _search_read_opts(fields, offset, limit, order)
+        return self._call(model, "search_read", [domain or []], opts)
 
     def search_count(self, model: str, domain: Domain | None = None) -> int:
-        return int(self.execute_kw(model, "search_count", domain or []))
+        return self._call(model, "search_count", [domain or []])
 
     # ----------------------- batch / pipeline utils -------------------------
     def execute_batch(self, calls: Iterable[Mapping[str, Any]]) -> List[Any]:
@@ -231,13 +670,14 @@ class OdooClient:
 
         Each item must be a mapping with keys: ``model``, ``method``,
         ``args`` (list) and optional ``kwargs`` (dict).
+
+        Note: stock Odoo's ``object.execute`` expects ``(model, method, *args)``
+        and rejects a list of calls – this needs a server-side extension that
+        dispatches it. To create many records of one model on a plain server
+        use the multi-create of :meth:`create` instead.
         """
-        return self._json_rpc(self._OBJECT, "execute", [
-            self.db,
-            self.uid or self.authenticate(),
-            self.api_key,
-            calls,
-        ])
+        prefix = self._auth_prefix or self._login_prefix()
+        return self._json_rpc(self._OBJECT, "execute", (*prefix, list(calls)))
 
     # --------------------------------------------------------------------- #
     # Project helpers
@@ -271,11 +711,13 @@ class OdooClient:
         vals: JSON = {"stage_id": stage_id}
         if state_label:
             try:
-                sel = self.selection_labels(self._TASK_MODEL, "state")
-                code = next(c for c, lbl in sel.items() if lbl.lower() == state_label.lower())
-                vals["state"] = code
-            except (StopIteration, KeyError):
+                code = _state_code(self.selection_labels(self._TASK_MODEL, "state"), state_label)
+            except KeyError:
+                code = None
+            if code is None:
                 logger.warning("State label '%s' not found – only stage moved", state_label)
+            else:
+                vals["state"] = code
         return self.update_task(task_id, vals)
 
     def update_task(self, task_id: int, values: JSON) -> bool:
@@ -297,17 +739,25 @@ class OdooClient:
         """
 
         p = Path(file_path)
-        data = base64.b64encode(p.read_bytes()).decode()  # Python-3 way :contentReference[oaicite:0]{index=0}
+        data = _b64_file(p)  # chunked: the raw file is never fully in memory
 
         return self.create(
             "ir.attachment",
-            {
-                "name": filename or p.name,
-                "datas": data,
-                "res_model": model or self._TASK_MODEL,
-                "res_id": res_id,
-                "mimetype": mimetype or "application/octet-stream",
-            },
+            _attachment_values(res_id, filename or p.name, data, model or self._TASK_MODEL, mimetype),
+        )
+
+    def attach_stream(self, res_id: int, filename: str, chunks: Iterable[bytes], *, model: str | None = None, mimetype: str | None = None) -> int:
+        """Like :meth:`attach_file` but fed by an iterable of byte *chunks*.
+
+        The content is base64-encoded on the fly, so neither a temporary file
+        nor a full raw copy of the upload is needed.
+        """
+        enc = _B64Encoder()
+        for chunk in chunks:
+            enc.feed(chunk)
+        return self.create(
+            "ir.attachment",
+            _attachment_values(res_id, filename, enc.getvalue(), model or self._TASK_MODEL, mimetype),
         )
 
     # ------------------------------------------------------------------ #
@@ -398,25 +848,68 @@ class OdooClient:
                     defaults: Optional[JSON] = None) -> int:
         """Duplica un record usando il metodo ORM ``copy``.
         Utile per clonare task template o interi progetti.  :contentReference[oaicite:2]{index=2}"""
-        return int(self.execute_kw(model, "copy", [record_id], defaults or {}))
+        return self._call(model, "copy", [[record_id], defaults or {}])
 
     def iter_search_read(self, model: str, domain: Domain | None = None, *,
                          batch: int = 100, **opts) -> Iterable[JSON]:
-        """Generatore che restituisce pagine successive senza esporre `offset/limit`."""
-        offset = 0
+        """Generatore che restituisce pagine successive senza esporre `offset/limit`.
+
+        Paginazione *keyset* su ``id`` (``id > last_id``, ``order="id"``): ogni
+        pagina è una scansione in avanti sull'indice, senza lo skip O(offset).
+        ``"id"`` viene aggiunto a ``fields`` se manca (``[]``/``None`` = tutti i
+        campi, id incluso); eventuali ``order`` e ``offset`` del chiamante sono
+        ignorati.
+        """
+        fields = opts.pop("fields", None)
+        if fields and "id" not in fields:
+            fields = [*fields, "id"]
+        opts.pop("order", None)
+        opts.pop("offset", None)  # sarebbe riapplicato a ogni pagina keyset
+        base = list(domain or [])
+        last_id = 0
         while True:
-            records = self.search_read(model, domain,
-                                       offset=offset, limit=batch, **opts)
-            if not records:
-                break
+            records = self.search_read(model, base + [["id", ">", last_id]],
+                                       fields=fields, limit=batch, order="id", **opts)
             yield from records
-            offset += len(records)      # avanza esattamente di quanto restituito
+            if len(records) < batch:    # pagina corta ⇒ ultima, niente RPC a vuoto
+                break
+            last_id = records[-1]["id"]
+
+    def iter_search_read_stream(self, model: str, domain: Domain | None = None, *,
+                                fields: Sequence[str] | None = None, offset: int = 0,
+                                limit: int | None = None, order: str | None = None) -> Iterator[JSON]:
+        """Come :meth:`search_read`, ma decodifica la risposta *in streaming*.
+
+        I record vengono prodotti man mano che arrivano dal socket (``ijson``),
+        quindi la memoria resta O(record) anche per risposte di molti MB.
+        Senza ``ijson`` installato ricade su :meth:`search_read`.
+        """
+        if ijson is None:
+            yield from self.search_read(model, domain, fields=fields, offset=offset, limit=limit, order=order)
+            return
+        opts = _search_read_opts(fields, offset, limit, order)
+        prefix = self._auth_prefix or self._login_prefix()
+        payload = _rpc_payload(self._OBJECT, "execute_kw", (*prefix, model, "search_read", [domain or []], opts))
+        _log_payload(payload)
+        with self._post(payload, stream=True) as resp:
+            resp.raw.decode_content = True  # let urllib3 undo Content-Encoding: gzip
+            building: Optional[str] = None  # "result.item" or "error" while assembling
+            for path, event, value in ijson.parse(resp.raw, use_float=True):
+                if building is None:
+                    if event != "start_map" or path not in ("result.item", "error"):
+                        continue
+                    building, builder = path, ijson.ObjectBuilder()
+                builder.event(event, value)
+                if path == building and event == "end_map":
+                    if building == "error":
+                        _rpc_result({"error": builder.value})  # raises RPCError
+                    yield builder.value
+                    building = None
 
     def read_group(self, model: str, fields: Sequence[str],
                    groupby: Sequence[str], domain: Domain | None = None) -> List[JSON]:
         """Aggregazioni server-side (somma, conteggio, media, …).  :contentReference[oaicite:4]{index=4}"""
-        return list(self.execute_kw(model, "read_group",
-                                    domain or [], fields, groupby))
+        return self._call(model, "read_group", [domain or [], fields, groupby])
 
     # ------------------------------------------------------------------ #
     #  Attachment utilities                                              #
@@ -431,13 +924,72 @@ class OdooClient:
                                 fields=fields or ["name", "mimetype", "datas_fname"])
 
 
+    def download_attachment(self, attachment_id: int) -> bytes:
+        """Raw content of an ``ir.attachment`` via ``/web/content`` – no base64.
+
+        Uses a web session on the same pooled ``Session`` (see
+        :meth:`iter_attachment`).
+        """
+        return b"".join(self.iter_attachment(attachment_id))
+
+    def iter_attachment(self, attachment_id: int, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Stream the raw content of an ``ir.attachment`` in *chunk_size* pieces.
+
+        The first call opens a web session through ``/web/session/authenticate``
+        (the cookie lives in the client's ``Session``); a 403/404 or login
+        redirect on a previously valid session triggers one re-login. Odoo only accepts the
+        account **password** there – API keys are limited to RPC – so
+        ``api_key`` must hold the password for this helper.
+        """
+        url = f"{self._web_base()}/web/content/{attachment_id}"
+        for _ in range(2):
+            fresh = not self._web_session
+            if fresh:
+                self._web_login()
+            with self._sess.get(url, params={"download": "true"}, stream=True, allow_redirects=False,
+                                timeout=self.timeout, verify=self.verify_ssl) as resp:
+                # /web/content is auth="public": an expired cookie surfaces as
+                # 403/404 (Access/UserError) or a redirect to /web/login – log in
+                # again once before trusting the answer.
+                if not fresh and (resp.is_redirect or resp.status_code in (403, 404)):
+                    self._web_session = False
+                    continue
+                if resp.is_redirect:
+                    raise AuthenticationError(f"Redirected to {resp.headers.get('Location')} after web login")
+                resp.raise_for_status()
+                yield from resp.iter_content(chunk_size)
+                return
+
+    def _web_base(self) -> str:
+        return self.url[: -len("/jsonrpc")] if self.url.endswith("/jsonrpc") else self.url
+
+    def _web_login(self) -> None:
+        payload = {
+            "jsonrpc": "2.0",
+            "method": "call",
+            "params": {"db": self.db, "login": self.username, "password": self.api_key},
+            "id": next(_rpc_ids),
+        }
+        resp = self._sess.post(f"{self._web_base()}/web/session/authenticate", data=_dumps(payload),
+                               headers=_JSON_HEADERS, timeout=self.timeout, verify=self.verify_ssl)
+        resp.raise_for_status()
+        result = _rpc_result(_loads(resp.content))
+        if not result or not result.get("uid"):
+            raise AuthenticationError("Web session login failed (API keys are not accepted here)")
+        self._web_session = True
+
     # --------------------------------------------------------------------- #
     #
     # --------------------------------------------------------------------- #
 
-    def bulk_write(self, model: str, id_vals_map: Mapping[int, JSON]) -> List[Any]:
+    def bulk_write(self, model: str, id_vals_map: Mapping[int, JSON]) -> List[bool]:
 
-        """Aggiornamenti massivi con una sola round-trip.
+        """Aggiornamenti massivi: una ``write`` multi-id per ogni gruppo di valori.
+
+        I record con gli stessi valori finiscono in un'unica :meth:`update`, quindi
+        "sposta 500 task nello stage X" costa una sola RPC. Il risultato ha un
+        ``bool`` per *gruppo* di valori distinti (nell'ordine di prima comparsa),
+        non uno per record.
 
         Parameters
         ----------
@@ -447,19 +999,307 @@ class OdooClient:
             Dict ``{record_id: {field: value, …}}``.
         """
 
-        calls = [
-            {
-                "model": model,
-                "method": "write",
-                "args": [[rid], vals],
-                "kwargs": {},
-            }
-            for rid, vals in id_vals_map.items()
-        ]
-        return self.execute_batch(calls)  # usa execute_batch interno :contentReference[oaicite:5]{index=5}
+        return [self.update(model, ids, vals) for ids, vals in _bulk_write_groups(id_vals_map)]
 
     # --------------------------------------------------------------------- #
     # Misc
     # --------------------------------------------------------------------- #
     def version(self) -> JSON:
         return self._json_rpc(self._COMMON, "version", [])
+
+
+# --------------------------------------------------------------------------- #
+# Async client
+# --------------------------------------------------------------------------- #
+
+class AsyncOdooClient:
+    """asyncio flavour of :class:`OdooClient` built on ``httpx.AsyncClient``.
+
+    Exposes the same helpers as the sync client, as coroutines, so independent
+    RPCs can run concurrently – over HTTP/2 they are multiplexed on a single
+    keep-alive connection:
+
+    >>> async with AsyncOdooClient(URL, DB, USER, KEY) as odoo:
+    ...     tasks, stages = await asyncio.gather(
+    ...         odoo.search_read("project.task", [["project_id", "=", prj]]),
+    ...         odoo.search_read("project.task.type", [["project_ids", "in", [prj]]]),
+    ...     )
+    ...     ids = await asyncio.gather(*(odoo.create_task(v) for v in values))
+
+    The HTTP client may be **injected** so that many lightweight instances
+    (e.g. one per web request) share a single connection pool.
+
+    Parameters
+    ----------
+    url, db, username, api_key, timeout, verify_ssl, gzip_threshold:
+        Same meaning as in :class:`OdooClient`.
+    client:
+        A ready ``httpx.AsyncClient`` whose lifetime is managed by the caller
+        (TLS verification, pool limits and HTTP/2 are configured there). When
+        omitted the instance owns an HTTP/2 client (HTTP/1.1 if ``h2`` is not
+        installed) and closes it in :meth:`aclose` / ``__aexit__``.
+    """
+
+    _COMMON = OdooClient._COMMON
+    _OBJECT = OdooClient._OBJECT
+    _PROJECT_MODEL = OdooClient._PROJECT_MODEL
+    _TASK_MODEL = OdooClient._TASK_MODEL
+    _STAGE_MODEL = OdooClient._STAGE_MODEL
+
+    # ---------------------------- lifecycle ---------------------------------
+    def __init__(
+        self,
+        url: str,
+        db: str,
+        username: str,
+        api_key: str,
+        *,
+        client: Optional["httpx.AsyncClient"] = None,
+        timeout: int = 30,
+        verify_ssl: bool = True,
+        gzip_threshold: Optional[int] = None,
+    ) -> None:
+        if httpx is None:  # pragma: no cover
+            raise ImportError("AsyncOdooClient requires `httpx` (pip install httpx)")
+        self.url = url.rstrip("/")
+        self.db = db
+        self.username = username
+        self.api_key = api_key
+        self.timeout = timeout
+        self.gzip_threshold = gzip_threshold
+        self._owns_client = client is None
+        if client is None:
+            opts = dict(verify=verify_ssl, timeout=timeout, headers={"Accept-Encoding": "gzip, deflate"})
+            try:
+                client = httpx.AsyncClient(http2=True, **opts)
+            except ImportError:  # `h2` missing – plain HTTP/1.1 keep-alive pool
+                client = httpx.AsyncClient(**opts)
+        self._client = client
+        self.uid: Optional[int] = None
+        self._auth_prefix: Optional[Tuple[str, int, str]] = None  # (db, uid, api_key) once authenticated
+        self._sel_cache: Dict[Tuple[str, str], Dict[str, str]] = {}
+        self._fields_cache: Dict[Tuple[str, Tuple[str, ...]], JSON] = {}
+
+    async def __aenter__(self) -> "AsyncOdooClient":
+        await self.authenticate()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this instance created it (injected ones
+        belong to the caller)."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    # -------------------------- private helpers -----------------------------
+    async def _post(self, payload: JSON) -> "httpx.Response":
+        """Async POST with the same retry policy as :meth:`OdooClient._post`."""
+        body, headers = _encode_body(payload, self.gzip_threshold)
+        delay = _BACKOFF_BASE
+        for attempt in range(3):
+            try:
+                resp = await self._client.post(self.url, content=body, headers=headers, timeout=self.timeout)
+                resp.raise_for_status()
+                return resp
+            except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+                http_error = isinstance(exc, httpx.HTTPStatusError)
+                if attempt == 2 or http_error and exc.response.status_code not in _RETRY_STATUS:
+                    raise
+                delay = _retry_delay(delay, exc.response.headers.get("Retry-After") if http_error else None)
+                logger.warning("Transient network error (%s) – retrying in %.2fs", exc, delay)
+                await asyncio.sleep(delay)
+        raise RuntimeError("Unreachable")  # pragma: no cover
+
+    async def _json_rpc(self, service: str, method: str, args: Sequence[Any]) -> Any:
+        payload = _rpc_payload(service, method, args)
+        _log_payload(payload)
+        return _rpc_result(_loads((await self._post(payload)).content))
+
+    # --------------------------- core methods -------------------------------
+    async def authenticate(self) -> int:
+        """Authenticate and cache *uid* (see :meth:`OdooClient.authenticate`)."""
+        result = await self._json_rpc(
+            self._COMMON,
+            "authenticate",
+            [self.db, self.username, self.api_key, {}],
+        )
+        if not isinstance(result, int):
+            raise AuthenticationError(result)
+        self.uid = result
+        self._auth_prefix = (self.db, result, self.api_key)
+        logger.info("Authenticated uid=%s", self.uid)
+        return result
+
+    async def execute_kw(self, model: str, method: str, *args: Sequence[Any], **kwargs: JSON) -> Any:
+        """Thin wrapper around ``object.execute_kw`` with auto-auth."""
+        prefix = self._auth_prefix or await self._login_prefix()
+        return await self._json_rpc(self._OBJECT, "execute_kw", (*prefix, model, method, list(args), kwargs or _EMPTY))
+
+    async def _login_prefix(self) -> Tuple[str, int, str]:
+        await self.authenticate()
+        return self._auth_prefix  # type: ignore[return-value]
+
+    # ----------------------------- utilities --------------------------------
+    async def fields_get(self, model: str, attributes: Sequence[str] | None = None) -> JSON:
+        """See :meth:`OdooClient.fields_get` – cached per client."""
+        key = (model, tuple(sorted(attributes or [])))
+        if key not in self._fields_cache:
+            self._fields_cache[key] = await self.execute_kw(model, "fields_get", [], attributes=list(key[1]))
+        return self._fields_cache[key]
+
+    async def selection_labels(self, model: str, field: str) -> Dict[str, str]:
+        """See :meth:`OdooClient.selection_labels` – cached per client."""
+        key = (model, field)
+        if key not in self._sel_cache:
+            meta = await self.fields_get(model, attributes=["selection"])
+            self._sel_cache[key] = dict(meta[field]["selection"])  # type: ignore[index]
+        return self._sel_cache[key]
+
+    clear_metadata_cache = OdooClient.clear_metadata_cache
+
+    # ----------------------- generic CRUD wrappers --------------------------
+    async def create(self, model: str, values: JSON | Sequence[JSON]) -> int | List[int]:
+        return await self.execute_kw(model, "create", values)
+
+    async def read(self, model: str, ids: Sequence[int], fields: Sequence[str] | None = None) -> List[JSON]:
+        return await self.execute_kw(model, "read", ids, fields or [])
+
+    async def update(self, model: str, ids: Sequence[int], values: JSON) -> bool:
+        return await self.execute_kw(model, "write", ids, values)
+
+    async def delete(self, model: str, ids: Sequence[int]) -> bool:
+        return await self.execute_kw(model, "unlink", ids)
+
+    async def search(self, model: str, domain: Domain | None = None, *, offset: int = 0, limit: int | None = None, order: str | None = None) -> List[int]:
+        return await self.execute_kw(model, "search", domain or [], offset, limit, order)
+
+    async def search_read(self, model: str, domain: Domain | None = None, *, fields: Sequence[str] | None = None, offset: int = 0, limit: int | None = None, order: str | None = None) -> List[JSON]:
+        opts = _search_read_opts(fields, offset, limit, order)
+        return await self.execute_kw(model, "search_read", domain or [], **opts)
+
+    async def search_count(self, model: str, domain: Domain | None = None) -> int:
+        return await self.execute_kw(model, "search_count", domain or [])
+
+    async def execute_batch(self, calls: Iterable[Mapping[str, Any]]) -> List[Any]:
+        """See :meth:`OdooClient.execute_batch`."""
+        prefix = self._auth_prefix or await self._login_prefix()
+        return await self._json_rpc(self._OBJECT, "execute", (*prefix, list(calls)))
+
+    # ----------------------------- projects ---------------------------------
+    async def create_project(self, values: JSON) -> int:
+        return await self.create(self._PROJECT_MODEL, values)
+
+    async def update_project(self, project_id: int, values: JSON) -> bool:
+        return await self.update(self._PROJECT_MODEL, [project_id], values)
+
+    async def delete_project(self, project_id: int) -> bool:
+        return await self.delete(self._PROJECT_MODEL, [project_id])
+
+    async def archive_project(self, project_id: int, *, active: bool = False) -> bool:
+        return await self.update_project(project_id, {"active": active})
+
+    # ------------------------------ stages ----------------------------------
+    async def create_stage(self, project_id: int, name: str, *,
+                           seq: int = 10, fold: bool = False) -> int:
+        return await self.create(self._STAGE_MODEL,
+                                 {"name": name,
+                                  "sequence": seq,
+                                  "fold": fold,
+                                  "project_ids": [(4, project_id)]})
+
+    async def update_stage(self, stage_id: int, values: JSON) -> bool:
+        return await self.update(self._STAGE_MODEL, [stage_id], values)
+
+    async def archive_stage(self, stage_id: int, *, active: bool = False) -> bool:
+        return await self.update(self._STAGE_MODEL, [stage_id], {"active": active})
+
+    async def delete_stage(self, stage_id: int) -> bool:
+        return await self.delete(self._STAGE_MODEL, [stage_id])
+
+    # ------------------------------- tasks ----------------------------------
+    async def create_task(self, values: JSON) -> int:
+        return await self.create(self._TASK_MODEL, values)
+
+    async def create_subtask(self, parent_id: int, values: JSON) -> int:
+        vals = dict(values)
+        vals["parent_id"] = parent_id
+        return await self.create_task(vals)
+
+    async def update_task(self, task_id: int, values: JSON) -> bool:
+        return await self.update(self._TASK_MODEL, [task_id], values)
+
+    async def set_task_description(self, task_id: int, html: str) -> bool:
+        return await self.update_task(task_id, {"description": html})
+
+    async def move_task(self, task_id: int, stage_id: int, *, state_label: str | None = None) -> bool:
+        vals: JSON = {"stage_id": stage_id}
+        if state_label:
+            try:
+                code = _state_code(await self.selection_labels(self._TASK_MODEL, "state"), state_label)
+            except KeyError:
+                code = None
+            if code is None:
+                logger.warning("State label '%s' not found – only stage moved", state_label)
+            else:
+                vals["state"] = code
+        return await self.update_task(task_id, vals)
+
+    async def delete_task(self, task_id: int) -> bool:
+        return await self.delete(self._TASK_MODEL, [task_id])
+
+    async def archive_task(self, task_id: int, *, active: bool = False) -> bool:
+        return await self.update_task(task_id, {"active": active})
+
+    async def assign_task(self, task_id: int, user_id: int, *,
+                          add_follower: bool = True) -> bool:
+        vals: JSON = {"user_id": user_id}
+        if add_follower:
+            vals["message_follower_ids"] = [(4, user_id)]
+        return await self.update_task(task_id, vals)
+
+    # ---------------------------- attachments -------------------------------
+    async def attach_file(self, res_id: int, file_path: Path | str, *, model: str | None = None, filename: str | None = None, mimetype: str | None = None) -> int:
+        """See :meth:`OdooClient.attach_file` – the file is read off-loop."""
+        p = Path(file_path)
+        data = await asyncio.to_thread(_b64_file, p)
+        return await self.create(
+            "ir.attachment",
+            _attachment_values(res_id, filename or p.name, data, model or self._TASK_MODEL, mimetype),
+        )
+
+    async def attach_stream(self, res_id: int, filename: str, chunks: AsyncIterable[bytes], *, model: str | None = None, mimetype: str | None = None) -> int:
+        """See :meth:`OdooClient.attach_stream` – *chunks* is an async iterable."""
+        enc = _B64Encoder()
+        async for chunk in chunks:
+            enc.feed(chunk)
+        return await self.create(
+            "ir.attachment",
+            _attachment_values(res_id, filename, enc.getvalue(), model or self._TASK_MODEL, mimetype),
+        )
+
+    async def list_attachments(self, res_model: str, res_id: int,
+                               *, fields: Sequence[str] | None = None) -> List[JSON]:
+        return await self.search_read("ir.attachment",
+                                      [["res_model", "=", res_model],
+                                       ["res_id", "=", res_id]],
+                                      fields=fields or ["name", "mimetype", "datas_fname"])
+
+    # ------------------------------ advanced --------------------------------
+    async def copy_record(self, model: str, record_id: int,
+                          defaults: Optional[JSON] = None) -> int:
+        return await self.execute_kw(model, "copy", [record_id], defaults or {})
+
+    async def read_group(self, model: str, fields: Sequence[str],
+                         groupby: Sequence[str], domain: Domain | None = None) -> List[JSON]:
+        return await self.execute_kw(model, "read_group", domain or [], fields, groupby)
+
+    async def bulk_write(self, model: str, id_vals_map: Mapping[int, JSON]) -> List[bool]:
+        """See :meth:`OdooClient.bulk_write` – one concurrent ``write`` per values group."""
+        return list(await asyncio.gather(*(
+            self.update(model, ids, vals) for ids, vals in _bulk_write_groups(id_vals_map)
+        )))
+
+    async def version(self) -> JSON:
+        return await self._json_rpc(self._COMMON, "version", [])
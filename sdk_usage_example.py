@@ -11,9 +11,12 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from functools import lru_cache
 from pprint import pprint
-from typing import Dict, List
+from string import Template
+from typing import Dict, List, Set
 
 from odoo_sdk import OdooClient   # ← importa lo SDK descritto
 
@@ -30,10 +33,9 @@ PROJECT_NAME = "SDK v0.4 Demo"   # usato sia in creazione che in ricerca
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
 
-def html_description(title: str) -> str:
-    """Ritorna un piccolo frammento HTML con tabella + logo."""
-    return f"""
-    <h3>{title}</h3>
+# Template compilato una sola volta all'import: cambia solo il titolo.
+_DESC_TMPL = Template("""
+    <h3>${title}</h3>
     <p>This task is tracked via the <strong>SDK v0.4 demo workflow</strong>.</p>
     <table border="1" cellpadding="4" cellspacing="0">
         <tr><th>Status</th><td>Draft</td></tr>
@@ -42,7 +44,13 @@ def html_description(title: str) -> str:
     <p style="text-align:center;margin-top:8px;">
         <img src="https://upload.wikimedia.org/wikipedia/commons/thumb/5/50/Odoo_logo.svg/600px-Odoo_logo.svg.png"
              width="120" alt="Odoo logo" />
-    </p>"""
+    </p>""").substitute
+
+
+@lru_cache(maxsize=128)
+def html_description(title: str) -> str:
+    """Ritorna un piccolo frammento HTML con tabella + logo (memoizzato per titolo)."""
+    return _DESC_TMPL(title=title)
 
 
 def create_demo_data(odoo: OdooClient) -> None:
@@ -50,56 +58,55 @@ def create_demo_data(odoo: OdooClient) -> None:
     project_id = odoo.create_project({"name": PROJECT_NAME})
     logging.info("Created project id=%s", project_id)
 
-    # colonne Scrum
-    stage_ids: Dict[str, int] = {}
-    for seq, name in enumerate(["Backlog", "To Do", "In Progress", "Done"], 1):
-        sid = odoo.create_stage(project_id, name, seq=seq, fold=name == "Done")
-        stage_ids[name] = sid
+    # colonne Scrum – indipendenti tra loro → in parallelo (Session thread-safe)
+    names = ["Backlog", "To Do", "In Progress", "Done"]
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        stage_ids: Dict[str, int] = dict(zip(names, ex.map(
+            lambda item: odoo.create_stage(project_id, item[1], seq=item[0], fold=item[1] == "Done"),
+            enumerate(names, 1),
+        )))
+    for name, sid in stage_ids.items():
         logging.info("  Stage %-12s → %s", name, sid)
 
+    # task principali: parent + fratelli con un'unica create multi-record
+    # (Odoo restituisce gli id nello stesso ordine dei valori)
     today = date.today()
-    parent_task = odoo.create_task(
-        {
-            "name": "Implement SDK core",
-            "project_id": project_id,
-            "stage_id": stage_ids["In Progress"],
-            "description": html_description("Implement SDK core"),
-            "date_deadline": (today + timedelta(days=10)).isoformat(),
-        }
-    )
-    logging.info("  Parent task id=%s", parent_task)
-
-    others = [
+    main_tasks = [
+        ("Implement SDK core", "In Progress", 10),
         ("Define requirements", "Backlog", 5),
         ("Set up repository", "To Do", 3),
         ("Write documentation", "To Do", 12),
         ("Quality assurance", "In Progress", 14),
         ("Release v1.0", "Done", 15),
     ]
-    for name, col, delta in others:
-        tid = odoo.create_task(
-            {
-                "name": name,
-                "project_id": project_id,
-                "stage_id": stage_ids[col],
-                "description": html_description(name),
-                "date_deadline": (today + timedelta(days=delta)).isoformat(),
-            }
-        )
+    parent_task, *task_ids = odoo.create("project.task", [
+        {
+            "name": name,
+            "project_id": project_id,
+            "stage_id": stage_ids[col],
+            "description": html_description(name),
+            "date_deadline": (today + timedelta(days=delta)).isoformat(),
+        }
+        for name, col, delta in main_tasks
+    ])
+    logging.info("  Parent task id=%s", parent_task)
+    for (name, col, _), tid in zip(main_tasks[1:], task_ids):
         logging.info("  Task '%s' (id=%s → %s)", name, tid, col)
 
-    # sotto-task
-    for sub in ["REST wrapper", "CLI utility", "Unit tests"]:
-        stid = odoo.create_subtask(
-            parent_id=parent_task,
-            values={
-                "name": sub,
-                "project_id": project_id,
-                "stage_id": stage_ids["In Progress"],
-                "description": html_description(sub),
-                "date_deadline": (today + timedelta(days=7)).isoformat(),
-            },
-        )
+    # sotto-task: dipendono dall'id del parent → seconda (e ultima) create
+    subs = ["REST wrapper", "CLI utility", "Unit tests"]
+    sub_ids = odoo.create("project.task", [
+        {
+            "name": sub,
+            "parent_id": parent_task,
+            "project_id": project_id,
+            "stage_id": stage_ids["In Progress"],
+            "description": html_description(sub),
+            "date_deadline": (today + timedelta(days=7)).isoformat(),
+        }
+        for sub in subs
+    ])
+    for sub, stid in zip(subs, sub_ids):
         logging.info("    Sub-task '%s' (id=%s)", sub, stid)
 
     # sposta il task padre a Done
@@ -132,36 +139,40 @@ def interactive_cleanup(odoo: OdooClient) -> None:
     for prj in projects:
         print(f"  • ID {prj['id']} – {prj['name']}")
 
+    # task e stage di *tutti* i progetti: due letture, poi raggruppo in locale
+    pids = [prj["id"] for prj in projects]
+    task_ids: Dict[int, List[int]] = {pid: [] for pid in pids}
+    for t in odoo.search_read("project.task", [["project_id", "in", pids]], fields=["id", "project_id"]):
+        task_ids[t["project_id"][0]].append(t["id"])
+    stage_ids: Dict[int, List[int]] = {pid: [] for pid in pids}
+    for st in odoo.search_read("project.task.type", [["project_ids", "in", pids]], fields=["id", "project_ids"]):
+        for pid in st["project_ids"]:
+            if pid in stage_ids:
+                stage_ids[pid].append(st["id"])
+
+    # conferme → tre unlink multi-id in totale: task, poi colonne, poi progetti
+    doomed: Dict[str, List[int]] = {"project.task": [], "project.task.type": [], "project.project": []}
+    scheduled: Set[int] = set()  # stage condivise tra progetti: una sola unlink
     for prj in projects:
         pid = prj["id"]
-        # task e stage collegati
-        task_ids: List[int] = odoo.search("project.task", [["project_id", "=", pid]])
-        stage_ids: List[int] = odoo.search(
-            "project.task.type",
-            [["project_ids", "in", [pid]]],
-        )
-
         print(f"\n===> Pronto a eliminare progetto {pid} «{prj['name']}»")
-        print(f"     Stage: {stage_ids}")
-        print(f"     Task : {task_ids}")
+        print(f"     Stage: {stage_ids[pid]}")
+        print(f"     Task : {task_ids[pid]}")
         ans = input("Confermi cancellazione completa? [y/N] ").strip().lower()
         if ans != "y":
             print("  » salto questo progetto.")
             continue
-
-        # 1. cancella task
-        if task_ids:
-            print("  • deleting tasks …")
-            odoo.delete("project.task", task_ids)
-
-        # 2. cancella colonne
-        if stage_ids:
-            print("  • deleting stages …")
-            odoo.delete_stage(stage_ids[0]) if len(stage_ids) == 1 else odoo.delete("project.task.type", stage_ids)
-
-        # 3. cancella progetto
-        print("  • deleting project …")
-        odoo.delete_project(pid)
+        stages = [sid for sid in stage_ids[pid] if sid not in scheduled]
+        scheduled.update(stages)
+        doomed["project.task"] += task_ids[pid]
+        doomed["project.task.type"] += stages
+        doomed["project.project"].append(pid)
+
+    if doomed["project.project"]:
+        print("  • deleting tasks, stages and projects …")
+        for model, ids in doomed.items():  # ordine: task → colonne → progetti
+            if ids:
+                odoo.delete(model, ids)
         print("  ✔ eliminato.\n")
 
 